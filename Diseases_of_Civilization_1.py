@@ -5,85 +5,50 @@ import base64
 from PIL import Image
 import base64
 from io import BytesIO
+import importlib
+import bmi_data
+from bmi_data import (
+    region_data, region_rates, global_average, charts,
+    diabetes_years, diabetes_prevalence, chd_years, chd_prevalence, cancer_years, cancer_mortality,
+)
+import bmi_api
 
 
 # ------------------ Load data for MAP ------------------
-# Set up updated region coordinates
-region_coords = {
-    "North America": (50, -100),
-    "Western Europe": (54, 6),
-    "Oceania": (-25, 135),
-    "Southeast and East Asia": (20, 110),
-    "Central and eastern Europe": (48, 30),
-    "High-income Asia Pacific": (35, 135),
-    "Latin America and Caribbean": (-15, -60),
-    "North Africa and Middle East": (30, 25),
-    "South Asia": (25, 80),
-    "Sub-Saharan Africa": (0, 20),
-}
-
-# Region data including obesity rate and top 5 countries
-region_data = {
-    "North America": {
-        "ObesityRate": 36.7,
-        "TopCountries": ["United States (42.9%)", "Canada (30.4%)"]
-    },
-    "Western Europe": {
-        "ObesityRate": 25.6,
-        "TopCountries": ["United Kingdom (30.7%)", "Ireland (28.0%)", "Germany (25.0%)", "Belgium (24.5%)", "France (23.9%)"]
-    },
-    "Oceania": {
-        "ObesityRate": 34.2,
-        "TopCountries": ["New Zealand (34.8%)", "Australia (33.5%)"]
-    },
-    "Southeast and East Asia": {
-        "ObesityRate": 7.5,
-        "TopCountries": ["Malaysia (19.5%)", "Vietnam (18.3%)", "Thailand (15.0%)", "China (7.3%)", "South Korea (6.7%)"]
-    },
-    "Central and eastern Europe": {
-        "ObesityRate": 33.1,
-        "TopCountries": ["Romania (38.2%)", "Hungary (36.4%)", "Croatia (35.7%)", "Poland (31.4%)", "Czech Republic (31.3%)"]
-    },
-    "High-income Asia Pacific": {
-        "ObesityRate": 6.2,
-        "TopCountries": ["Singapore (9.0%)", "South Korea (6.7%)", "Japan (4.9%)"]
-    },
-    "Latin America and Caribbean": {
-        "ObesityRate": 33.0,
-        "TopCountries": ["Chile (39.5%)", "Barbados (38.2%)", "Mexico (36.1%)", "Argentina (36.0%)", "Jamaica (34.2%)"]
-    },
-    "North Africa and Middle East": {
-        "ObesityRate": 33.5,
-        "TopCountries": ["Kuwait (45.4%)", "Qatar (43.8%)", "Egypt (43.0%)", "Saudi Arabia (41.1%)", "Iraq (37.4%)"]
-    },
-    "South Asia": {
-        "ObesityRate": 10.0,
-        "TopCountries": ["Pakistan (21.9%)", "Sri Lanka (10.6%)", "India (7.2%)", "Nepal (6.6%)", "Bangladesh (5.3%)"]
-    },
-    "Sub-Saharan Africa": {
-        "ObesityRate": 10.2,
-        "TopCountries": ["South Africa (30.0%)", "Kenya (11.0%)", "Tanzania (11.4%)", "Zambia (9.4%)", "Mozambique (8.8%)"]
-    }
-}
+# Region, donut and trend data live in bmi_data so the JSON API serves the same numbers
+
+# Streamlit only re-imports the edited module, so refresh bmi_api if it still holds older data
+if bmi_api.SOURCE_HASH != bmi_data.source_hash():
+    bmi_api = importlib.reload(bmi_api)
+
+
+# Start the read-only data API once per data version, not on every rerun.
+# max_entries=1 evicts the previous version, so undoing an edit restarts the server too.
+# Bind failures are logged once by bmi_api and the page carries on without the API.
+@st.cache_resource(max_entries=1, show_spinner=False)
+def start_data_api(source_hash):
+    return bmi_api.ensure_managed_server(source_hash)
+
+start_data_api(bmi_api.SOURCE_HASH)
 
 # Build DataFrame for plotting
 data = []
-for region, coords in region_coords.items():
-    obesity = region_data[region]["ObesityRate"]
+for row in region_rates():
+    region = row["region"]
     top = "<br>".join([f"&nbsp;&nbsp;&nbsp;&nbsp;• {c}" for c in region_data[region]["TopCountries"]])
     hover = f"<b>{region}</b><br>Top Countries:<br>{top}"
     data.append({
         "Region": region,
-        "lat": coords[0],
-        "lon": coords[1],
-        "ObesityRate": obesity,
+        "lat": row["lat"],
+        "lon": row["lon"],
+        "ObesityRate": row["obesity_rate"],
         "hover_label": hover
     })
 
 filtered_df = pd.DataFrame(data)
 
-# Calculate global average
-world_rate = filtered_df['ObesityRate'].mean()
+# Global average, same value /api/regions serves
+world_rate = global_average()
 
 # ------------------ Layout section ------------------
 # Outer circle markers
@@ -205,34 +170,6 @@ colors = [
     "rgba(239, 135, 192, 1)",  # Overweight (pink)
     "rgba(255, 195, 113, 1)"   # Obese (soft yellow-orange)
 ]
-# Chart data
-charts = [
-    {
-        "title": "USA in 1960s",
-        "values": [55, 32, 13],
-        "labels": ["Normal weight", "Overweight", "Obese"]
-    },
-    {
-        "title": "Global in 1960s",
-        "values": [80, 15, 5],
-        "labels": ["Normal weight", "Overweight", "Obese"]
-    },
-    {
-        "title": "USA in 2023",
-        "values": [26, 31, 43],
-        "labels": ["Normal weight", "Overweight", "Obese"]
-    },
-    {
-        "title": "Global in 2022",
-        "values": [57, 26, 17],
-        "labels": ["Normal weight", "Overweight", "Obese"]
-    },
-    {
-        "title": "Global Projection (2050)",
-        "values": [40, 35, 25],
-        "labels": ["Normal weight", "Overweight", "Obese"]
-    }
-]
 # Layout rows
 rows = [
     charts[0:2],
@@ -311,18 +248,6 @@ with left_col:
 
 
 #----------Disease increase----------------
-# Diabetes Data
-diabetes_years = [1890, 1935, 1961, 2000, 2016, 2024]
-diabetes_prevalence = [0.0028, 0.37, 1.8, 5.8, 13.0, 16.0]  # In percent
-
-# CHD Data
-chd_years = [1800, 1912, 1930, 2010]
-chd_prevalence = [0.0001, 0.01, 10, 32]
-
-# Cancer Mortality Data
-cancer_years = [1811, 1900, 2010]
-cancer_mortality = [1/188*100, 1/17*100, 1/3*100]  # ≈ 0.53%, 5.88%, 33.33%
-
 with right_col:
     # Title
     st.markdown("### The Steep Rise of Chronic Diseases in the U.S.")
@@ -0,0 +1,309 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import namedtuple
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import bmi_data
+
+
+# ------------------ Read-only JSON API over the BMI aggregates ------------------
+# Serves the same numbers Diseases_of_Civilization_1.py renders, so other tools
+# don't have to scrape the page (and re-run the whole script) to get them.
+#
+#   GET /api/regions             region obesity rates + global average
+#   GET /api/countries           country ranking, ?page=&per_page=&region=
+#                                (a region filter keeps each country's global rank)
+#   GET /api/trends              US chronic disease series
+#   GET /api/weight-categories   normal / overweight / obese breakdowns
+
+API_HOST = os.environ.get("BMI_API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("BMI_API_PORT", "8600"))
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+GZIP_MIN_BYTES = 256
+
+# Computed once per process; every ETag is derived from it
+SOURCE_HASH = bmi_data.source_hash()
+
+logger = logging.getLogger(__name__)
+
+Resource = namedtuple("Resource", ["body", "gzipped", "etag"])
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _positive_int(params, name, default):
+    raw = params.get(name, [None])[-1]
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ApiError(400, f"'{name}' must be an integer")
+    if value < 1:
+        raise ApiError(400, f"'{name}' must be at least 1")
+    return value
+
+
+def _countries_payload(page, per_page, region):
+    rows = _country_rankings()
+    if region is not None:
+        rows = [row for row in rows if region in row["regions"]]
+    total = len(rows)
+    pages = max(1, -(-total // per_page))
+    if page > pages:
+        raise ApiError(404, f"page {page} out of range (1-{pages})")
+    start = (page - 1) * per_page
+    return {
+        "items": rows[start:start + per_page],
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "pages": pages,
+    }
+
+
+@lru_cache(maxsize=1)
+def _country_rankings():
+    return bmi_data.country_rankings()
+
+
+# Query parameters each endpoint accepts; anything else is rejected
+ENDPOINT_PARAMS = {
+    "/api/regions": (),
+    "/api/countries": ("page", "per_page", "region"),
+    "/api/trends": (),
+    "/api/weight-categories": (),
+}
+
+
+def _resolve(path, query):
+    # Validate the request and reduce it to the values that shape the response,
+    # so equivalent queries share one cache entry and one ETag
+    if path not in ENDPOINT_PARAMS:
+        raise ApiError(404, f"no such endpoint '{path}'")
+    params = parse_qs(query)
+    unknown = sorted(set(params) - set(ENDPOINT_PARAMS[path]))
+    if unknown:
+        raise ApiError(400, f"unknown parameter(s): {', '.join(unknown)}")
+    if path == "/api/countries":
+        page = _positive_int(params, "page", 1)
+        per_page = min(_positive_int(params, "per_page", DEFAULT_PER_PAGE), MAX_PER_PAGE)
+        region = params.get("region", [None])[-1]
+        if region is not None and region not in bmi_data.region_data:
+            raise ApiError(404, f"unknown region '{region}'")
+        return (path, page, per_page, region)
+    return (path,)
+
+
+def _payload(key):
+    path = key[0]
+    if path == "/api/regions":
+        return {"regions": bmi_data.region_rates(), "global_average": round(bmi_data.global_average(), 2)}
+    if path == "/api/countries":
+        return _countries_payload(*key[1:])
+    if path == "/api/trends":
+        return {"trends": bmi_data.disease_trends()}
+    return {"charts": bmi_data.weight_categories()}
+
+
+@lru_cache(maxsize=256)
+def _resource(key):
+    # Keyed on the resolved request so repeat requests skip JSON encoding and gzip
+    body = json.dumps(_payload(key), separators=(",", ":")).encode()
+    tag = hashlib.sha256(f"{SOURCE_HASH}:{key!r}".encode()).hexdigest()[:32]
+    gzipped = gzip.compress(body, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+    return Resource(body, gzipped, f'"{tag}"')
+
+
+def _accepts_gzip(header):
+    # An explicit gzip entry wins over "*", whatever order they come in
+    qvalues = {}
+    for part in (header or "").split(","):
+        coding, *params = [piece.strip() for piece in part.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.lower()] = q
+    if "gzip" in qvalues:
+        return qvalues["gzip"] > 0
+    return qvalues.get("*", 0.0) > 0
+
+
+def _etag_matches(header, etag):
+    # If-None-Match uses weak comparison, and the gzip variant only differs by suffix
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.replace('-gzip"', '"') == etag:
+            return True
+    return False
+
+
+class BmiApiHandler(BaseHTTPRequestHandler):
+    server_version = "BmiDataAPI/1.0"
+
+    def do_GET(self):
+        self._respond(include_body=True)
+
+    def do_HEAD(self):
+        self._respond(include_body=False)
+
+    def _method_not_allowed(self):
+        self._send_error(ApiError(405, "read-only API, use GET"), include_body=True, extra={"Allow": "GET, HEAD"})
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = _method_not_allowed
+
+    def _respond(self, include_body):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        try:
+            resource = _resource(_resolve(path, url.query))
+        except ApiError as error:
+            self._send_error(error, include_body)
+            return
+
+        use_gzip = resource.gzipped is not None and _accepts_gzip(self.headers.get("Accept-Encoding"))
+        etag = resource.etag[:-1] + '-gzip"' if use_gzip else resource.etag
+
+        if _etag_matches(self.headers.get("If-None-Match"), resource.etag):
+            self.send_response(304)
+            self._common_headers(etag)
+            self.end_headers()
+            return
+
+        body = resource.gzipped if use_gzip else resource.body
+        self.send_response(200)
+        self._common_headers(etag)
+        self.send_header("Content-Type", "application/json")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def _common_headers(self, etag):
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+
+    def _send_error(self, error, include_body, extra=None):
+        body = json.dumps({"error": error.message}).encode()
+        self.send_response(error.status)
+        for name, value in (extra or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Background servers share the Streamlit console, so keep them quiet there
+        if getattr(self.server, "quiet", False):
+            return
+        super().log_message(format, *args)
+
+
+def create_server(host=API_HOST, port=API_PORT, quiet=False):
+    server = ThreadingHTTPServer((host, port), BmiApiHandler)
+    server.quiet = quiet
+    return server
+
+
+def serve_in_background(host=API_HOST, port=API_PORT):
+    server = create_server(host, port, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, name="bmi-data-api", daemon=True)
+    thread.start()
+    return server
+
+
+# The server the Streamlit page runs is found through its thread, which carries the
+# server and the data version it was started for. Unlike a Streamlit cache entry or
+# a module global, that survives "Clear cache" and reloads of this module.
+MANAGED_THREAD_NAME = "bmi-data-api-managed"
+
+_managed_lock = threading.Lock()
+# Data version whose server failed to bind, so reruns don't retry and re-log it
+_bind_failed_for = None
+
+
+def _managed_thread():
+    for thread in threading.enumerate():
+        if thread.name == MANAGED_THREAD_NAME:
+            return thread
+    return None
+
+
+def stop_managed_server():
+    global _bind_failed_for
+    with _managed_lock:
+        _bind_failed_for = None
+        _stop_managed_thread()
+
+
+def _stop_managed_thread():
+    thread = _managed_thread()
+    if thread is not None:
+        thread.server.shutdown()
+        thread.server.server_close()
+        thread.join()
+
+
+def ensure_managed_server(source_hash, host=API_HOST, port=API_PORT):
+    # Keep one background server per process; replace it whenever the data version
+    # differs, including when an edit is undone (A -> B -> A)
+    global _bind_failed_for
+    with _managed_lock:
+        thread = _managed_thread()
+        if thread is not None and thread.source_hash == source_hash:
+            return thread.server
+        _stop_managed_thread()
+        if _bind_failed_for == source_hash:
+            return None
+        try:
+            server = create_server(host, port, quiet=True)
+        except OSError as error:
+            _bind_failed_for = source_hash
+            logger.warning("BMI data API could not start on %s:%s: %s", host, port, error)
+            return None
+        _bind_failed_for = None
+        thread = threading.Thread(target=server.serve_forever, name=MANAGED_THREAD_NAME, daemon=True)
+        thread.server = server
+        thread.source_hash = source_hash
+        thread.start()
+        return server
+
+
+if __name__ == "__main__":
+    server = create_server()
+    print(f"Serving BMI data API on http://{API_HOST}:{API_PORT}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
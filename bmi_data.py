@@ -0,0 +1,170 @@
+import hashlib
+import json
+import re
+
+
+# ------------------ Region data for MAP ------------------
+# Set up updated region coordinates
+region_coords = {
+    "North America": (50, -100),
+    "Western Europe": (54, 6),
+    "Oceania": (-25, 135),
+    "Southeast and East Asia": (20, 110),
+    "Central and eastern Europe": (48, 30),
+    "High-income Asia Pacific": (35, 135),
+    "Latin America and Caribbean": (-15, -60),
+    "North Africa and Middle East": (30, 25),
+    "South Asia": (25, 80),
+    "Sub-Saharan Africa": (0, 20),
+}
+
+# Region data including obesity rate and top 5 countries
+region_data = {
+    "North America": {
+        "ObesityRate": 36.7,
+        "TopCountries": ["United States (42.9%)", "Canada (30.4%)"]
+    },
+    "Western Europe": {
+        "ObesityRate": 25.6,
+        "TopCountries": ["United Kingdom (30.7%)", "Ireland (28.0%)", "Germany (25.0%)", "Belgium (24.5%)", "France (23.9%)"]
+    },
+    "Oceania": {
+        "ObesityRate": 34.2,
+        "TopCountries": ["New Zealand (34.8%)", "Australia (33.5%)"]
+    },
+    "Southeast and East Asia": {
+        "ObesityRate": 7.5,
+        "TopCountries": ["Malaysia (19.5%)", "Vietnam (18.3%)", "Thailand (15.0%)", "China (7.3%)", "South Korea (6.7%)"]
+    },
+    "Central and eastern Europe": {
+        "ObesityRate": 33.1,
+        "TopCountries": ["Romania (38.2%)", "Hungary (36.4%)", "Croatia (35.7%)", "Poland (31.4%)", "Czech Republic (31.3%)"]
+    },
+    "High-income Asia Pacific": {
+        "ObesityRate": 6.2,
+        "TopCountries": ["Singapore (9.0%)", "South Korea (6.7%)", "Japan (4.9%)"]
+    },
+    "Latin America and Caribbean": {
+        "ObesityRate": 33.0,
+        "TopCountries": ["Chile (39.5%)", "Barbados (38.2%)", "Mexico (36.1%)", "Argentina (36.0%)", "Jamaica (34.2%)"]
+    },
+    "North Africa and Middle East": {
+        "ObesityRate": 33.5,
+        "TopCountries": ["Kuwait (45.4%)", "Qatar (43.8%)", "Egypt (43.0%)", "Saudi Arabia (41.1%)", "Iraq (37.4%)"]
+    },
+    "South Asia": {
+        "ObesityRate": 10.0,
+        "TopCountries": ["Pakistan (21.9%)", "Sri Lanka (10.6%)", "India (7.2%)", "Nepal (6.6%)", "Bangladesh (5.3%)"]
+    },
+    "Sub-Saharan Africa": {
+        "ObesityRate": 10.2,
+        "TopCountries": ["South Africa (30.0%)", "Kenya (11.0%)", "Tanzania (11.4%)", "Zambia (9.4%)", "Mozambique (8.8%)"]
+    }
+}
+
+# ------------------ Weight category breakdowns (donuts) ------------------
+charts = [
+    {
+        "title": "USA in 1960s",
+        "values": [55, 32, 13],
+        "labels": ["Normal weight", "Overweight", "Obese"]
+    },
+    {
+        "title": "Global in 1960s",
+        "values": [80, 15, 5],
+        "labels": ["Normal weight", "Overweight", "Obese"]
+    },
+    {
+        "title": "USA in 2023",
+        "values": [26, 31, 43],
+        "labels": ["Normal weight", "Overweight", "Obese"]
+    },
+    {
+        "title": "Global in 2022",
+        "values": [57, 26, 17],
+        "labels": ["Normal weight", "Overweight", "Obese"]
+    },
+    {
+        "title": "Global Projection (2050)",
+        "values": [40, 35, 25],
+        "labels": ["Normal weight", "Overweight", "Obese"]
+    }
+]
+
+# ------------------ Chronic disease trends (US) ------------------
+# Diabetes Data
+diabetes_years = [1890, 1935, 1961, 2000, 2016, 2024]
+diabetes_prevalence = [0.0028, 0.37, 1.8, 5.8, 13.0, 16.0]  # In percent
+
+# CHD Data
+chd_years = [1800, 1912, 1930, 2010]
+chd_prevalence = [0.0001, 0.01, 10, 32]
+
+# Cancer Mortality Data
+cancer_years = [1811, 1900, 2010]
+cancer_mortality = [1/188*100, 1/17*100, 1/3*100]  # ≈ 0.53%, 5.88%, 33.33%
+
+
+# ------------------ Aggregates shared by the page and the data API ------------------
+# "United States (42.9%)" -> ("United States", 42.9)
+_country_pattern = re.compile(r"^(?P<name>.+?)\s*\((?P<rate>[\d.]+)%\)$")
+
+
+def parse_country(entry):
+    match = _country_pattern.match(entry)
+    return match.group("name"), float(match.group("rate"))
+
+
+def region_rates():
+    return [
+        {"region": region, "lat": region_coords[region][0], "lon": region_coords[region][1],
+         "obesity_rate": info["ObesityRate"]}
+        for region, info in region_data.items()
+    ]
+
+
+def global_average():
+    rates = [info["ObesityRate"] for info in region_data.values()]
+    return sum(rates) / len(rates)
+
+
+def country_rankings():
+    # One row per country, highest obesity rate first; ties keep region order.
+    # A country listed under several regions (e.g. South Korea) keeps all of them.
+    rows = {}
+    for region, info in region_data.items():
+        for entry in info["TopCountries"]:
+            name, rate = parse_country(entry)
+            row = rows.setdefault(name, {"country": name, "obesity_rate": rate, "regions": []})
+            row["regions"].append(region)
+    ranked = sorted(rows.values(), key=lambda row: -row["obesity_rate"])
+    return [dict(row, rank=rank) for rank, row in enumerate(ranked, start=1)]
+
+
+def disease_trends():
+    return {
+        "type_2_diabetes": {"metric": "prevalence_pct", "years": diabetes_years, "values": diabetes_prevalence},
+        "coronary_heart_disease": {"metric": "prevalence_pct", "years": chd_years, "values": chd_prevalence},
+        "cancer_mortality": {"metric": "mortality_pct", "years": cancer_years, "values": cancer_mortality},
+    }
+
+
+def weight_categories():
+    return [
+        {"title": chart["title"], "breakdown": dict(zip(chart["labels"], chart["values"]))}
+        for chart in charts
+    ]
+
+
+def source_hash():
+    # Stable digest of all raw inputs; changes whenever any number above is edited
+    source = {
+        "region_coords": region_coords,
+        "region_data": region_data,
+        "charts": charts,
+        "diabetes": [diabetes_years, diabetes_prevalence],
+        "chd": [chd_years, chd_prevalence],
+        "cancer": [cancer_years, cancer_mortality],
+    }
+    encoded = json.dumps(source, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
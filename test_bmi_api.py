@@ -0,0 +1,162 @@
+import gzip
+import http.client
+import importlib
+import json
+import socket
+import unittest
+
+import bmi_api
+
+
+class BmiApiTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = bmi_api.serve_in_background(port=0)
+        cls.port = cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def request(self, path, headers=None, method="GET"):
+        connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        try:
+            connection.request(method, path, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, response, response.read()
+        finally:
+            connection.close()
+
+    def test_regions_ok(self):
+        status, response, body = self.request("/api/regions")
+        self.assertEqual(status, 200)
+        self.assertEqual(response.getheader("Content-Type"), "application/json")
+        self.assertEqual(len(json.loads(body)["regions"]), 10)
+
+    def test_countries_listed_once(self):
+        status, _, body = self.request("/api/countries?per_page=100")
+        self.assertEqual(status, 200)
+        payload = json.loads(body)
+        names = [row["country"] for row in payload["items"]]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(payload["total"], len(names))
+
+    def test_if_none_match_returns_304(self):
+        _, response, _ = self.request("/api/countries?page=2&per_page=5")
+        etag = response.getheader("ETag")
+        status, _, body = self.request("/api/countries?page=2&per_page=5", {"If-None-Match": etag})
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+
+    def test_equivalent_queries_share_etag(self):
+        _, clamped, _ = self.request("/api/countries?per_page=1000")
+        _, capped, _ = self.request("/api/countries?per_page=100")
+        _, reordered, _ = self.request("/api/countries?per_page=100&page=1")
+        self.assertEqual(clamped.getheader("ETag"), capped.getheader("ETag"))
+        self.assertEqual(capped.getheader("ETag"), reordered.getheader("ETag"))
+
+    def test_gzip_negotiation(self):
+        status, response, body = self.request("/api/countries", {"Accept-Encoding": "gzip"})
+        self.assertEqual(status, 200)
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertTrue(response.getheader("ETag").endswith('-gzip"'))
+        self.assertIn("items", json.loads(gzip.decompress(body)))
+
+        _, response, _ = self.request("/api/countries", {"Accept-Encoding": "*;q=0, gzip"})
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+
+        _, response, _ = self.request("/api/countries", {"Accept-Encoding": "gzip;q=0, *"})
+        self.assertIsNone(response.getheader("Content-Encoding"))
+
+    def test_gzip_etag_revalidates(self):
+        headers = {"Accept-Encoding": "gzip"}
+        _, response, _ = self.request("/api/countries", headers)
+        status, _, _ = self.request("/api/countries", dict(headers, **{"If-None-Match": response.getheader("ETag")}))
+        self.assertEqual(status, 304)
+
+    def test_head_has_no_body(self):
+        status, response, body = self.request("/api/trends", method="HEAD")
+        self.assertEqual(status, 200)
+        self.assertEqual(body, b"")
+        self.assertGreater(int(response.getheader("Content-Length")), 0)
+
+    def test_region_filter_keeps_global_ranks(self):
+        _, _, body = self.request("/api/countries?region=Oceania")
+        payload = json.loads(body)
+        self.assertEqual(payload["total"], 2)
+        self.assertEqual([row["country"] for row in payload["items"]], ["New Zealand", "Australia"])
+        self.assertEqual([row["rank"] for row in payload["items"]], [14, 16])
+
+    def test_page_out_of_range(self):
+        status, _, body = self.request("/api/countries?page=99")
+        self.assertEqual(status, 404)
+        self.assertIn("out of range", json.loads(body)["error"])
+
+    def test_invalid_page(self):
+        self.assertEqual(self.request("/api/countries?page=0")[0], 400)
+        self.assertEqual(self.request("/api/countries?page=x")[0], 400)
+
+    def test_unknown_region(self):
+        self.assertEqual(self.request("/api/countries?region=Atlantis")[0], 404)
+
+    def test_unknown_parameter(self):
+        self.assertEqual(self.request("/api/regions?x=1")[0], 400)
+
+    def test_unknown_endpoint(self):
+        self.assertEqual(self.request("/api/nope")[0], 404)
+
+    def test_post_not_allowed(self):
+        status, response, _ = self.request("/api/regions", method="POST")
+        self.assertEqual(status, 405)
+        self.assertEqual(response.getheader("Allow"), "GET, HEAD")
+
+
+class ManagedServerTest(unittest.TestCase):
+    def tearDown(self):
+        bmi_api.stop_managed_server()
+
+    def test_same_version_reuses_server(self):
+        first = bmi_api.ensure_managed_server("A", port=0)
+        self.assertIs(bmi_api.ensure_managed_server("A", port=0), first)
+
+    def test_undoing_an_edit_restarts_server(self):
+        # A -> B -> A must end with a live server for A, not the one started for B
+        server_a = bmi_api.ensure_managed_server("A", port=0)
+        server_b = bmi_api.ensure_managed_server("B", port=0)
+        self.assertIsNot(server_b, server_a)
+        server_a_again = bmi_api.ensure_managed_server("A", port=0)
+        self.assertIsNot(server_a_again, server_a)
+        self.assertIsNot(server_a_again, server_b)
+
+        # The B server was shut down and its socket closed
+        self.assertEqual(server_b.socket.fileno(), -1)
+        port = server_a_again.server_address[1]
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        connection.request("GET", "/api/regions")
+        self.assertEqual(connection.getresponse().status, 200)
+        connection.close()
+
+    def test_server_survives_module_reload(self):
+        # Clearing Streamlit's cache or reloading bmi_api must not orphan the server
+        server = bmi_api.ensure_managed_server("A", port=0)
+        importlib.reload(bmi_api)
+        self.assertIs(bmi_api.ensure_managed_server("A", port=0), server)
+        self.assertIsNot(bmi_api.ensure_managed_server("B", port=0), server)
+        self.assertEqual(server.socket.fileno(), -1)
+
+    def test_bind_failure_is_logged_once(self):
+        with socket.socket() as taken:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen()
+            port = taken.getsockname()[1]
+            with self.assertLogs("bmi_api", level="WARNING"):
+                self.assertIsNone(bmi_api.ensure_managed_server("A", port=port))
+            with self.assertNoLogs("bmi_api", level="WARNING"):
+                self.assertIsNone(bmi_api.ensure_managed_server("A", port=port))
+        # A new data version tries to bind again
+        self.assertIsNotNone(bmi_api.ensure_managed_server("B", port=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import copy
+import unittest
+
+import bmi_data
+
+
+class SourceHashTest(unittest.TestCase):
+    def setUp(self):
+        self.original = copy.deepcopy(bmi_data.region_data)
+
+    def tearDown(self):
+        bmi_data.region_data.clear()
+        bmi_data.region_data.update(self.original)
+
+    def test_stable_for_same_data(self):
+        self.assertEqual(bmi_data.source_hash(), bmi_data.source_hash())
+
+    def test_changes_with_a_value(self):
+        before = bmi_data.source_hash()
+        bmi_data.region_data["Oceania"]["ObesityRate"] = 34.3
+        edited = bmi_data.source_hash()
+        self.assertNotEqual(edited, before)
+        bmi_data.region_data["Oceania"]["ObesityRate"] = 34.2
+        self.assertEqual(bmi_data.source_hash(), before)
+
+
+class CountryRankingsTest(unittest.TestCase):
+    def setUp(self):
+        self.rows = bmi_data.country_rankings()
+
+    def test_sorted_by_rate_and_ranked(self):
+        rates = [row["obesity_rate"] for row in self.rows]
+        self.assertEqual(rates, sorted(rates, reverse=True))
+        self.assertEqual([row["rank"] for row in self.rows], list(range(1, len(self.rows) + 1)))
+        self.assertEqual(self.rows[0]["country"], "Kuwait")
+        self.assertEqual(self.rows[0]["obesity_rate"], 45.4)
+
+    def test_one_row_per_country(self):
+        names = [row["country"] for row in self.rows]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(len(names), 41)
+
+    def test_south_korea_keeps_both_regions(self):
+        south_korea = next(row for row in self.rows if row["country"] == "South Korea")
+        self.assertEqual(south_korea["obesity_rate"], 6.7)
+        self.assertEqual(south_korea["regions"], ["Southeast and East Asia", "High-income Asia Pacific"])
+
+
+class GlobalAverageTest(unittest.TestCase):
+    def test_matches_region_mean(self):
+        # The page used to show filtered_df['ObesityRate'].mean() over the ten regions: 230.0 / 10
+        self.assertAlmostEqual(bmi_data.global_average(), 23.0)
+        rates = [row["obesity_rate"] for row in bmi_data.region_rates()]
+        self.assertAlmostEqual(bmi_data.global_average(), sum(rates) / len(rates))
+
+
+if __name__ == "__main__":
+    unittest.main()